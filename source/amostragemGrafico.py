@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+
+# ===============================================================
+# REDUÇÃO DE PONTOS PARA GRÁFICOS DE SÉRIES LONGAS
+# ===============================================================
+#
+# Com dezenas de milhares de execuções por algoritmo, desenhar cada amostra
+# com marker deixa a renderização lenta e o PNG ilegível. Aqui a série é
+# reduzida (LTTB) só na hora de plotar e recebe sobreposições de mediana
+# móvel e faixa de percentis. Os dados brutos (JSON/CSV) não são alterados.
+
+# Até aqui a série é desenhada inteira, como antes
+MAX_PONTOS = 1000
+
+
+def lttb(y, n_saida):
+    """Índices escolhidos pelo Largest-Triangle-Three-Buckets.
+
+    Mantém o primeiro e o último ponto e, em cada balde intermediário, o
+    ponto que forma o maior triângulo com o ponto anterior escolhido e a
+    média do balde seguinte (preserva picos melhor que amostrar a cada k).
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_saida >= n or n_saida < 3:
+        return np.arange(n)
+
+    limites = np.linspace(1, n - 1, n_saida - 1).astype(np.int64)
+    idx = np.empty(n_saida, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+
+    a = 0
+    for b in range(n_saida - 2):
+        ini, fim = limites[b], limites[b + 1]
+        if b + 2 < len(limites):
+            prox_ini, prox_fim = limites[b + 1], limites[b + 2]
+        else:
+            prox_ini, prox_fim = n - 1, n
+        media_x = (prox_ini + prox_fim - 1) / 2
+        media_y = y[prox_ini:prox_fim].mean()
+
+        xs = np.arange(ini, fim)
+        areas = np.abs((a - media_x) * (y[ini:fim] - y[a]) - (a - xs) * (media_y - y[a]))
+        a = ini + int(np.argmax(areas))
+        idx[b + 1] = a
+
+    return idx
+
+
+def faixa_movel(y, janela, inferior=5, superior=95):
+    """Mediana móvel e percentis móveis (janela centrada)."""
+    serie = pd.Series(np.asarray(y, dtype=float))
+    rolagem = serie.rolling(janela, center=True, min_periods=1)
+    return (rolagem.median().values,
+            rolagem.quantile(inferior / 100).values,
+            rolagem.quantile(superior / 100).values)
+
+
+def plotar_serie(ax, tempos, label, cor, max_pontos=MAX_PONTOS, janela=None):
+    """Plota uma série de execuções com custo limitado a ~max_pontos pontos.
+
+    Séries curtas saem como sempre (todas as amostras com marker). Séries
+    longas viram uma linha LTTB clara + mediana móvel + faixa p5–p95.
+    """
+    tempos = np.asarray(tempos, dtype=float)
+    n = len(tempos)
+    if n <= max_pontos:
+        ax.plot(np.arange(n), tempos, label=label, marker="o", markersize=4,
+                linewidth=1, color=cor, alpha=0.9)
+        return
+
+    idx = lttb(tempos, max_pontos)
+    ax.plot(idx, tempos[idx], color=cor, linewidth=0.6, alpha=0.35,
+            label=f"{label} (LTTB, {len(idx)} de {n} pts)")
+
+    janela = janela or max(5, n // 100)
+    mediana, baixo, alto = faixa_movel(tempos, janela)
+    sel = np.linspace(0, n - 1, max_pontos).astype(np.int64)
+    ax.fill_between(sel, baixo[sel], alto[sel], color=cor, alpha=0.15,
+                    linewidth=0, label=f"{label} p5–p95 (janela {janela})")
+    ax.plot(sel, mediana[sel], color=cor, linewidth=1.5, label=f"{label} mediana móvel")
@@ -3,10 +3,13 @@ import random
 import statistics
 import matplotlib.pyplot as plt
 import seaborn as sns
+import numpy as np
 import os
 import json
 import csv
 
+from amostragemGrafico import plotar_serie
+
 # ...existing code...
 
 # tema bonito
@@ -75,6 +78,75 @@ def merge(left, right):
     return result
 
 
+# Radix Sort LSD (linear: O(d·n), d = nº de bytes da maior chave)
+# Somente chaves inteiras; negativos são deslocados para começar em zero.
+def radix_sort(arr):
+    arr = arr.copy()
+    if len(arr) <= 1:
+        return arr
+    if set(map(type, arr)) != {int}:
+        raise TypeError("radix_sort só aceita chaves inteiras")
+
+    menor = min(arr)
+    maior = max(arr)
+    amplitude = maior - menor
+
+    # numpy só se chaves e deslocamentos couberem em int64
+    if -2 ** 63 <= menor and maior < 2 ** 63 and amplitude < 2 ** 63:
+        return _radix_sort_numpy(arr, menor, amplitude)
+
+    chaves = [x - menor for x in arr] if menor else arr
+    desloc = 0
+    while amplitude >> desloc:
+        baldes = [[] for _ in range(256)]
+        for x in chaves:
+            baldes[(x >> desloc) & 0xFF].append(x)
+        chaves = [x for balde in baldes for x in balde]
+        desloc += 8
+
+    return [x + menor for x in chaves] if menor else chaves
+
+
+# Mesmo LSD por bytes, mas cada passada é vetorizada: extrai o dígito de
+# todas as chaves de uma vez e reordena com argsort estável. O dígito vira
+# uint8 para o numpy usar radix sort (em int64 ele usaria timsort, O(n log n))
+def _radix_sort_numpy(arr, menor, amplitude):
+    chaves = np.asarray(arr, dtype=np.int64) - np.int64(menor)
+    desloc = 0
+    while amplitude >> desloc:
+        digito = ((chaves >> desloc) & 0xFF).astype(np.uint8)
+        chaves = chaves[np.argsort(digito, kind="stable")]
+        desloc += 8
+    return (chaves + np.int64(menor)).tolist()
+
+
+# Counting Sort (linear: O(n + k), k = max - min + 1)
+# Só compensa para faixas limitadas: acima de max_amplitude gera ValueError.
+CONTAGEM_MAX_AMPLITUDE = 10_000_000
+
+
+def counting_sort(arr, max_amplitude=CONTAGEM_MAX_AMPLITUDE):
+    if len(arr) <= 1:
+        return arr.copy()
+    if set(map(type, arr)) != {int}:
+        raise TypeError("counting_sort só aceita chaves inteiras")
+
+    menor = min(arr)
+    amplitude = max(arr) - menor + 1
+    if amplitude > max_amplitude:
+        raise ValueError(f"faixa de valores ({amplitude}) maior que max_amplitude ({max_amplitude})")
+
+    contagem = [0] * amplitude
+    for x in arr:
+        contagem[x - menor] += 1
+
+    result = []
+    for v, c in enumerate(contagem):
+        if c:
+            result.extend([v + menor] * c)
+    return result
+
+
 # ===============================================================
 # 2. FUNÇÕES DE MEDIÇÃO DE TEMPO
 # ===============================================================
@@ -107,6 +179,29 @@ def find_n0(limit=200, rep=30):
     return None
 
 
+# Menor n a partir do qual um algoritmo linear (radix/counting) vence o
+# híbrido, nos mesmos dados aleatórios usados por find_n0
+def find_crossover(algoritmo, n0, limit=2000, passo=5, rep=30):
+    nome = algoritmo.__name__
+    print(f"Calculando crossover {nome} x hybrid_sort, aguarde...")
+
+    for n in range(5, limit, passo):
+        linear_times = []
+        hybrid_times = []
+
+        for _ in range(rep):
+            arr = [random.randint(0, 1_000_000) for _ in range(n)]
+            linear_times.append(tempo(algoritmo, arr))
+            hybrid_times.append(tempo(lambda a: hybrid_sort(a, n0), arr))
+
+        if statistics.mean(linear_times) < statistics.mean(hybrid_times):
+            print(f"crossover {nome} encontrado ≈ {n}")
+            return n
+
+    print(f"crossover {nome} não encontrado dentro do limite.")
+    return None
+
+
 # Medir tempos individuais + estatísticas
 def medir_tempo(algoritmo, dados, rep=100, n0=None):
     tempos = []
@@ -161,7 +256,7 @@ def _save_and_maybe_show(titulo, sufixo):
 
 
 def grafico_medias(result, titulo):
-    algs = ["insertion", "merge", "hibrido"]
+    algs = list(result.keys())
     # converter para ms para melhor leitura
     valores_ms = [result[a]["media"] / 1e6 for a in algs]
 
@@ -178,11 +273,14 @@ def grafico_execucoes(result, titulo):
     ax = plt.gca()
 
     # plotar cada algoritmo; converter lista para ms
-    for alg, cor in zip(result.keys(), ["#1f77b4", "#ff7f0e", "#2ca02c"]):
+    # (séries longas são reduzidas com LTTB + mediana/percentis móveis só no gráfico)
+    cores = sns.color_palette("tab10", n_colors=len(result))
+    for alg, cor in zip(result.keys(), cores):
         tempos_ms = [t / 1e6 for t in result[alg]["lista"]]
-        sns.lineplot(x=range(len(tempos_ms)), y=tempos_ms, label=alg, color=cor, ax=ax, marker="o", linewidth=1)
+        plotar_serie(ax, tempos_ms, alg, cor)
 
-    plt.title("100 Execuções - " + titulo)
+    n_exec = max(len(stats["lista"]) for stats in result.values())
+    plt.title(f"{n_exec} Execuções - " + titulo)
     plt.xlabel("Execução")
     plt.ylabel("Tempo (ms)")
     plt.legend()
@@ -190,7 +288,7 @@ def grafico_execucoes(result, titulo):
 
 
 def grafico_min_max_media(result, titulo):
-    algs = ["insertion", "merge", "hibrido"]
+    algs = list(result.keys())
     mins_ms = [result[a]["min"] / 1e6 for a in algs]
     maxs_ms = [result[a]["max"] / 1e6 for a in algs]
     medias_ms = [result[a]["media"] / 1e6 for a in algs]
@@ -220,6 +318,12 @@ if __name__ == "__main__":
     n0 = find_n0(limit=800, rep=200)
     print(f"\nn0 usado no híbrido = {n0}\n")
 
+    # A partir de que tamanho os algoritmos lineares vencem o híbrido
+    n_radix = find_crossover(radix_sort, n0)
+    # counting depende da faixa (0..1_000_000), então só vence com n bem maior
+    n_counting = find_crossover(counting_sort, n0, limit=100_000, passo=2_500, rep=5)
+    print(f"\ncrossover radix = {n_radix}, crossover counting = {n_counting}\n")
+
     # Coleções de dados (10k conforme enunciado)
     dados_ordenados = list(range(10_000))
     dados_inversos = list(range(10_000, 0, -1))
@@ -229,12 +333,16 @@ if __name__ == "__main__":
         "ordenados": {
             "insertion": medir_tempo(insertion_sort, dados_ordenados),
             "merge": medir_tempo(merge_sort, dados_ordenados),
-            "hibrido": medir_tempo(hybrid_sort, dados_ordenados, n0=n0)
+            "hibrido": medir_tempo(hybrid_sort, dados_ordenados, n0=n0),
+            "radix": medir_tempo(radix_sort, dados_ordenados),
+            "counting": medir_tempo(counting_sort, dados_ordenados)
         },
         "inversos": {
             "insertion": medir_tempo(insertion_sort, dados_inversos),
             "merge": medir_tempo(merge_sort, dados_inversos),
-            "hibrido": medir_tempo(hybrid_sort, dados_inversos, n0=n0)
+            "hibrido": medir_tempo(hybrid_sort, dados_inversos, n0=n0),
+            "radix": medir_tempo(radix_sort, dados_inversos),
+            "counting": medir_tempo(counting_sort, dados_inversos)
         }
     }
 
@@ -0,0 +1,137 @@
+import asyncio
+import csv
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+from servidorOrdenacao import HOST, PORTA
+
+# ===============================================================
+# GERADOR DE CARGA PARA O SERVIDOR DE ORDENAÇÃO
+# ===============================================================
+#
+# Abre N conexões simultâneas contra o servidor local e mede, para cada
+# nível de concorrência, a latência (p50/p95/p99) e a vazão (pedidos/s).
+# Se o servidor não estiver no ar, ele é iniciado como subprocesso.
+
+FIGS_DIR = "figs"
+os.makedirs(FIGS_DIR, exist_ok=True)
+
+NIVEIS_CONCORRENCIA = [1, 4, 16, 64]
+PEDIDOS_POR_CONEXAO = 50
+TAMANHO_PEDIDO = 200
+
+
+def percentis(latencias):
+    """p50, p95 e p99 (mesma unidade da entrada)."""
+    if len(latencias) < 2:
+        v = latencias[0] if latencias else 0.0
+        return v, v, v
+    q = statistics.quantiles(latencias, n=100, method="inclusive")
+    return q[49], q[94], q[98]
+
+
+async def _cliente(host, porta, n_pedidos, tamanho, latencias):
+    reader, writer = await asyncio.open_connection(host, porta, limit=2 ** 26)
+    try:
+        for i in range(n_pedidos):
+            dados = [random.randint(0, 1_000_000) for _ in range(tamanho)]
+            linha = (json.dumps({"id": i, "dados": dados}) + "\n").encode("utf-8")
+
+            inicio = time.perf_counter_ns()
+            writer.write(linha)
+            await writer.drain()
+            resposta = json.loads(await reader.readline())
+            fim = time.perf_counter_ns()
+
+            if "erro" in resposta:
+                raise RuntimeError(f"servidor respondeu erro: {resposta['erro']}")
+            if resposta["resultado"] != sorted(dados):
+                raise RuntimeError("servidor devolveu lista fora de ordem")
+            latencias.append(fim - inicio)
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def medir_nivel(concorrencia, host=HOST, porta=PORTA,
+                      pedidos=PEDIDOS_POR_CONEXAO, tamanho=TAMANHO_PEDIDO):
+    latencias = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*[
+        _cliente(host, porta, pedidos, tamanho, latencias) for _ in range(concorrencia)
+    ])
+    duracao = time.perf_counter() - inicio
+
+    p50, p95, p99 = percentis(latencias)
+    return {
+        "concorrencia": concorrencia,
+        "pedidos": len(latencias),
+        "tamanho": tamanho,
+        "p50_ms": p50 / 1e6,
+        "p95_ms": p95 / 1e6,
+        "p99_ms": p99 / 1e6,
+        "vazao_req_s": len(latencias) / duracao,
+    }
+
+
+async def _servidor_no_ar(host, porta):
+    try:
+        _, writer = await asyncio.open_connection(host, porta)
+    except OSError:
+        return False
+    writer.close()
+    await writer.wait_closed()
+    return True
+
+
+async def _aguardar_servidor(host, porta, timeout=30.0):
+    prazo = time.monotonic() + timeout
+    while time.monotonic() < prazo:
+        if await _servidor_no_ar(host, porta):
+            return
+        await asyncio.sleep(0.1)
+    raise RuntimeError(f"servidor não respondeu em {host}:{porta}")
+
+
+async def rodar_carga(niveis=NIVEIS_CONCORRENCIA, host=HOST, porta=PORTA):
+    processo = None
+    if not await _servidor_no_ar(host, porta):
+        print("Servidor não encontrado, iniciando subprocesso...")
+        script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "servidorOrdenacao.py")
+        processo = subprocess.Popen([sys.executable, script])
+        await _aguardar_servidor(host, porta)
+
+    resultados = []
+    try:
+        # aquecimento: sobe os workers do pool antes de medir
+        await medir_nivel(1, host, porta, pedidos=5)
+        for c in niveis:
+            r = await medir_nivel(c, host, porta)
+            resultados.append(r)
+            print(f"concorrência={c:4d}  pedidos={r['pedidos']:6d}  "
+                  f"p50={r['p50_ms']:8.3f} ms  p95={r['p95_ms']:8.3f} ms  "
+                  f"p99={r['p99_ms']:8.3f} ms  vazão={r['vazao_req_s']:9.1f} req/s")
+    finally:
+        if processo is not None:
+            processo.terminate()
+            processo.wait()
+
+    return resultados
+
+
+if __name__ == "__main__":
+    print(f"Carga contra {HOST}:{PORTA} ({PEDIDOS_POR_CONEXAO} pedidos/conexão, "
+          f"{TAMANHO_PEDIDO} elementos/pedido)\n")
+    resultados = asyncio.run(rodar_carga())
+
+    csv_path = os.path.join(FIGS_DIR, "carga_servidor.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.DictWriter(cf, fieldnames=list(resultados[0].keys()))
+        writer.writeheader()
+        writer.writerows(resultados)
+    print(f"\nResultados salvos em: {os.path.abspath(csv_path)}")
@@ -6,6 +6,8 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 import numpy as np
 
+from amostragemGrafico import plotar_serie
+
 FIGS_DIR = "figs"
 os.makedirs(FIGS_DIR, exist_ok=True)
 
@@ -181,7 +183,8 @@ def min_med_max_por_colecao(df):
 
 def linhas_execucoes(df):
     """Gera duas versões: linear e log-scale para comparar execuções individuais.
-    Usa marker pequeno e alpha para evitar sobreposição; garante todas as algs presentes."""
+    Usa marker pequeno e alpha para evitar sobreposição; garante todas as algs presentes.
+    Séries longas são reduzidas só no desenho (ver amostragemGrafico.plotar_serie)."""
     for colecao in df["collection"].unique():
         sub = df[df["collection"] == colecao]
         algs = sorted(sub["algoritmo"].unique())
@@ -192,7 +195,7 @@ def linhas_execucoes(df):
         ax = plt.gca()
         for alg, c in zip(algs, colors):
             tempos = sub[sub["algoritmo"] == alg].sort_values("execucao_index")["tempo_ms"].values
-            ax.plot(np.arange(len(tempos)), tempos, label=alg, marker="o", markersize=4, linewidth=1, color=c, alpha=0.9)
+            plotar_serie(ax, tempos, alg, c)
         ax.set_title(f"Execuções Individuais - {colecao} (linear)")
         ax.set_xlabel("Execução")
         ax.set_ylabel("Tempo (ms)")
@@ -207,7 +210,7 @@ def linhas_execucoes(df):
         ax.set_yscale("log")
         for alg, c in zip(algs, colors):
             tempos = sub[sub["algoritmo"] == alg].sort_values("execucao_index")["tempo_ms"].values
-            ax.plot(np.arange(len(tempos)), tempos, label=alg, marker="o", markersize=4, linewidth=1, color=c, alpha=0.9)
+            plotar_serie(ax, tempos, alg, c)
         ax.set_title(f"Execuções Individuais - {colecao} (log scale)")
         ax.set_xlabel("Execução")
         ax.set_ylabel("Tempo (ms) - escala log")
@@ -0,0 +1,355 @@
+import os
+import csv
+import time
+import random
+import bisect
+import weakref
+import threading
+
+from analiseAlg import FIGS_DIR, hybrid_sort, merge, merge_sort
+from ordenacaoParcial import merge_lazy_varias
+
+# ===============================================================
+# COLEÇÃO ORDENADA INCREMENTAL (estilo LSM)
+# ===============================================================
+#
+# Em vez de reordenar tudo a cada lote novo, os itens vão para um buffer;
+# quando ele enche, é ordenado com hybrid_sort e vira uma "run" imutável.
+# Runs de tamanho parecido são intercaladas (merge) por uma thread em
+# segundo plano, então o número de runs fica em O(log n) e as consultas
+# fazem uma busca binária por run.
+#
+# Como as runs nunca são alteradas depois de criadas, a compactação
+# intercala fora da trava e só troca as listas no final: consultas feitas
+# nesse meio tempo continuam vendo um estado consistente.
+#
+# A thread guarda só uma referência fraca para a coleção: quando ninguém
+# mais usa a coleção ela é coletada e a thread encerra sozinha. Para
+# encerrar antes, use fechar() ou "with ColecaoOrdenada() as c:".
+
+
+def _mesclar_varias(runs):
+    """Intercala várias runs ordenadas, duas a duas, com merge()."""
+    runs = list(runs)
+    if not runs:
+        return []
+    while len(runs) > 1:
+        proximas = [merge(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            proximas.append(runs[-1])
+        runs = proximas
+    return runs[0]
+
+
+# marcador de "coleção vazia" (None pode ser um item válido)
+_SEM_ITENS = object()
+
+
+def _acordar(condicao):
+    with condicao:
+        condicao.notify_all()
+
+
+def _compactador(ref, condicao):
+    """Laço da thread de compactação (ref: weakref para a coleção)."""
+    while True:
+        with condicao:
+            colecao = ref()
+            while colecao is not None and not colecao._fechado:
+                # com erro pendente, espera compactar() entregá-lo antes de tentar de novo
+                escolhidas = None if colecao._erro else colecao._escolher_mesclagem()
+                if escolhidas is not None:
+                    break
+                colecao._ocupado = False
+                condicao.notify_all()
+                # não segura a coleção enquanto espera
+                colecao = None
+                if ref() is None:
+                    return
+                condicao.wait()
+                colecao = ref()
+            if colecao is None or colecao._fechado:
+                if colecao is not None:
+                    colecao._ocupado = False
+                    condicao.notify_all()
+                return
+            colecao._ocupado = True
+
+        # merge fora da trava: inserções e consultas seguem normalmente
+        try:
+            nova = _mesclar_varias(escolhidas)
+        except Exception as erro:
+            # as runs antigas continuam no lugar; o erro vai para quem chamar compactar()
+            with condicao:
+                colecao._erro = erro
+                colecao._ocupado = False
+                condicao.notify_all()
+        else:
+            with condicao:
+                colecao._substituir(escolhidas, nova)
+        colecao = escolhidas = nova = None
+
+
+class ColecaoOrdenada:
+    """Multiconjunto ordenado com inserção amortizada barata.
+
+    - adicionar / adicionar_lote: O(1) amortizado no buffer + ordenação do
+      buffer cheio com hybrid_sort
+    - bisect_left / bisect_right / contar / in: uma busca binária por run
+    - intervalo(lo, hi): itens com lo <= x < hi, em ordem
+    - iteração: todos os itens em ordem, sob demanda (merge preguiçoso das
+      runs: ler só os primeiros k custa ~O(k log runs))
+
+    Cada item novo é comparado com um item já guardado antes de entrar no
+    buffer: um item não comparável (ex.: string numa coleção de números)
+    levanta TypeError e fica de fora, junto com os seguintes do mesmo lote;
+    os anteriores continuam na coleção. Se ainda assim ordenar o buffer
+    falhar, só os itens da chamada que falhou são descartados. Se a
+    compactação em segundo plano falhar, a exceção sobe em compactar().
+    """
+
+    def __init__(self, itens=(), capacidade_buffer=1024, n0=32, fator=4, em_segundo_plano=True):
+        if capacidade_buffer < 1:
+            raise ValueError("capacidade_buffer deve ser pelo menos 1")
+        if fator < 2:
+            # com fator 1 _nivel nunca termina e nenhuma mesclagem reduz as runs
+            raise ValueError("fator deve ser pelo menos 2")
+        self.capacidade_buffer = capacidade_buffer
+        self.n0 = n0
+        self.fator = fator
+        self._buffer = []
+        self._runs = []
+        self._tamanho = 0
+        # reentrante: o finalizador pode rodar na própria thread de compactação
+        self._trava = threading.RLock()
+        self._condicao = threading.Condition(self._trava)
+        self._ocupado = False
+        self._fechado = False
+        self._erro = None
+        self._thread = None
+        if em_segundo_plano:
+            self._thread = threading.Thread(target=_compactador,
+                                            args=(weakref.ref(self), self._condicao),
+                                            daemon=True)
+            self._thread.start()
+            weakref.finalize(self, _acordar, self._condicao).atexit = False
+        self.adicionar_lote(itens)
+
+    # ----------------------------------------------------------- inserção
+
+    def adicionar(self, x):
+        self.adicionar_lote((x,))
+
+    def adicionar_lote(self, itens):
+        with self._trava:
+            # itens desta chamada ainda no buffer começam em "inicio"
+            inicio = len(self._buffer)
+            if self._buffer:
+                ref = self._buffer[0]
+            elif self._runs:
+                ref = self._runs[0][0]
+            else:
+                ref = _SEM_ITENS
+            for x in itens:
+                if ref is _SEM_ITENS:
+                    ref = x
+                else:
+                    # TypeError aqui, antes de o item entrar no buffer
+                    x < ref
+                self._buffer.append(x)
+                self._tamanho += 1
+                if len(self._buffer) >= self.capacidade_buffer:
+                    self._descarregar(inicio)
+                    inicio = 0
+
+    # chamada com a trava já adquirida; se a ordenação falhar, descarta
+    # self._buffer[inicio:] (os itens da chamada atual) e mantém o resto
+    def _descarregar(self, inicio):
+        if not self._buffer:
+            return
+        try:
+            run = hybrid_sort(self._buffer, self.n0)
+        except Exception:
+            self._tamanho -= len(self._buffer) - inicio
+            del self._buffer[inicio:]
+            raise
+        self._buffer = []
+        self._runs.append(run)
+        if self._thread is None:
+            self._compactar_sincrono()
+        else:
+            self._condicao.notify_all()
+
+    # ---------------------------------------------------------- compactação
+
+    def _nivel(self, run):
+        """Faixa de tamanho da run: 0 até capacidade, 1 até capacidade*fator, ..."""
+        nivel, limite = 0, self.capacidade_buffer
+        while len(run) > limite:
+            nivel += 1
+            limite *= self.fator
+        return nivel
+
+    # chamada com a trava já adquirida: escolhe "fator" runs do mesmo nível
+    def _escolher_mesclagem(self):
+        por_nivel = {}
+        for run in self._runs:
+            por_nivel.setdefault(self._nivel(run), []).append(run)
+        for nivel in sorted(por_nivel):
+            if len(por_nivel[nivel]) >= self.fator:
+                return por_nivel[nivel][:self.fator]
+        return None
+
+    def _substituir(self, antigas, nova):
+        ids = {id(r) for r in antigas}
+        self._runs = [r for r in self._runs if id(r) not in ids]
+        self._runs.append(nova)
+
+    def _compactar_sincrono(self):
+        while True:
+            escolhidas = self._escolher_mesclagem()
+            if escolhidas is None:
+                return
+            self._substituir(escolhidas, _mesclar_varias(escolhidas))
+
+    def compactar(self):
+        """Descarrega o buffer e espera a compactação em segundo plano terminar."""
+        with self._condicao:
+            # nada aqui é desta chamada: em caso de erro o buffer fica como está
+            self._descarregar(len(self._buffer))
+            if self._thread is None:
+                return
+            while True:
+                if self._erro is not None:
+                    erro, self._erro = self._erro, None
+                    self._condicao.notify_all()
+                    raise erro
+                if not self._ocupado and self._escolher_mesclagem() is None:
+                    return
+                self._condicao.notify_all()
+                self._condicao.wait()
+
+    def fechar(self):
+        """Encerra a thread de compactação (a coleção continua utilizável, síncrona)."""
+        if self._thread is None:
+            return
+        with self._condicao:
+            self._fechado = True
+            self._condicao.notify_all()
+        self._thread.join()
+        self._thread = None
+        with self._trava:
+            self._erro = None
+            self._compactar_sincrono()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    # ------------------------------------------------------------ consultas
+
+    def _estado(self):
+        with self._trava:
+            return list(self._runs), list(self._buffer)
+
+    def __len__(self):
+        return self._tamanho
+
+    def bisect_left(self, x):
+        """Quantos itens são < x (posição de x na ordem global)."""
+        runs, buffer = self._estado()
+        return sum(bisect.bisect_left(r, x) for r in runs) + sum(1 for v in buffer if v < x)
+
+    def bisect_right(self, x):
+        """Quantos itens são <= x."""
+        runs, buffer = self._estado()
+        return sum(bisect.bisect_right(r, x) for r in runs) + sum(1 for v in buffer if v <= x)
+
+    def contar(self, x):
+        runs, buffer = self._estado()
+        total = sum(bisect.bisect_right(r, x) - bisect.bisect_left(r, x) for r in runs)
+        return total + buffer.count(x)
+
+    def __contains__(self, x):
+        runs, buffer = self._estado()
+        for r in runs:
+            i = bisect.bisect_left(r, x)
+            if i < len(r) and r[i] == x:
+                return True
+        return x in buffer
+
+    def intervalo(self, lo, hi):
+        """Itens com lo <= x < hi, em ordem."""
+        runs, buffer = self._estado()
+        pedacos = [r[bisect.bisect_left(r, lo):bisect.bisect_left(r, hi)] for r in runs]
+        pedacos.append(hybrid_sort([v for v in buffer if lo <= v < hi], self.n0))
+        return _mesclar_varias(p for p in pedacos if p)
+
+    def __iter__(self):
+        runs, buffer = self._estado()
+        return merge_lazy_varias(runs + [hybrid_sort(buffer, self.n0)])
+
+
+# ===============================================================
+# BENCHMARK: coleção incremental vs reordenar tudo a cada lote
+# ===============================================================
+
+def benchmark_colecao(lotes=200, tamanho_lote=500, n0=32):
+    """Absorve lotes aleatórios e, após cada lote, faz uma consulta de intervalo.
+
+    Compara o custo amortizado por item inserido entre:
+    - merge_sort(tudo): reordenar a lista inteira a cada lote (como hoje)
+    - hybrid + merge: ordenar só o lote e intercalar com a lista (O(n) por lote)
+    - ColecaoOrdenada
+    """
+    dados_lotes = [[random.randint(0, 1_000_000) for _ in range(tamanho_lote)] for _ in range(lotes)]
+    consultas = [(v, v + 10_000) for v in (random.randint(0, 990_000) for _ in range(lotes))]
+    total_itens = lotes * tamanho_lote
+
+    def reordenar_tudo():
+        dados = []
+        for lote, (lo, hi) in zip(dados_lotes, consultas):
+            dados = merge_sort(dados + lote)
+            dados[bisect.bisect_left(dados, lo):bisect.bisect_left(dados, hi)]
+        return dados
+
+    def intercalar_lote():
+        dados = []
+        for lote, (lo, hi) in zip(dados_lotes, consultas):
+            dados = merge(dados, hybrid_sort(lote, n0))
+            dados[bisect.bisect_left(dados, lo):bisect.bisect_left(dados, hi)]
+        return dados
+
+    def colecao():
+        with ColecaoOrdenada(capacidade_buffer=tamanho_lote, n0=n0) as c:
+            for lote, (lo, hi) in zip(dados_lotes, consultas):
+                c.adicionar_lote(lote)
+                c.intervalo(lo, hi)
+            c.compactar()
+            return list(c)
+
+    esperado = sorted(x for lote in dados_lotes for x in lote)
+    linhas = []
+    for nome, func in [("merge_sort(tudo)", reordenar_tudo),
+                       ("hybrid + merge", intercalar_lote),
+                       ("ColecaoOrdenada", colecao)]:
+        inicio = time.perf_counter_ns()
+        resultado = func()
+        duracao = time.perf_counter_ns() - inicio
+        assert resultado == esperado, f"{nome} produziu ordem errada"
+        por_item = duracao / total_itens
+        print(f"{nome:18s} total={duracao / 1e6:10.1f} ms  amortizado={por_item:9.0f} ns/item")
+        linhas.append([nome, lotes, tamanho_lote, duracao, por_item])
+
+    csv_path = os.path.join(FIGS_DIR, "colecao_ordenada.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.writer(cf)
+        writer.writerow(["estrategia", "lotes", "tamanho_lote", "tempo_total_ns", "ns_por_item"])
+        writer.writerows(linhas)
+    print(f"\nResultados salvos em: {os.path.abspath(csv_path)}")
+
+
+if __name__ == "__main__":
+    benchmark_colecao()
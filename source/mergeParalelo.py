@@ -0,0 +1,187 @@
+import os
+import csv
+import math
+import mmap
+import random
+import statistics
+import tempfile
+from array import array
+from multiprocessing import Pool
+
+from analiseAlg import FIGS_DIR, merge, tempo
+
+# ===============================================================
+# MERGE PARALELO (merge path / co-rank)
+# ===============================================================
+#
+# A saída de merge(a, b) tem len(a) + len(b) posições. Para cada posição k
+# da saída, co_rank(k, a, b) descobre por busca binária quantos elementos de
+# "a" (i) e de "b" (j = k - i) aparecem antes dela. Com isso a saída é cortada
+# em p fatias independentes: cada worker intercala a[i0:i1] com b[j0:j1] e
+# escreve direto na sua fatia de um buffer compartilhado.
+
+# Abaixo disso o custo de subir os processos não compensa
+MIN_PARALELO = 100_000
+
+INT64_MIN, INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+
+def co_rank(k, a, b):
+    """Quantos elementos de "a" estão entre os k primeiros de merge(a, b).
+
+    Empates vão para "a" (como em merge: left[i] <= right[j]), então o corte
+    encontrado reproduz exatamente a ordem do merge sequencial.
+    """
+    lo = max(0, k - len(b))
+    hi = min(k, len(a))
+    while lo < hi:
+        i = (lo + hi) // 2
+        # a[i] <= b[k-i-1]: a[i] sai antes de b[k-i-1], então i é pequeno demais
+        if a[i] <= b[k - i - 1]:
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+
+def _codigo_tipo(a, b):
+    """Typecode do buffer compartilhado ('q' ou 'd'), ou None se não servir."""
+    tipos = set(map(type, a)) | set(map(type, b))
+    if tipos == {int}:
+        menor = min(min(a, default=0), min(b, default=0))
+        maior = max(max(a, default=0), max(b, default=0))
+        if INT64_MIN <= menor and maior <= INT64_MAX:
+            return "q"
+    elif tipos == {float}:
+        # NaN quebra a busca binária (comparações sempre falsas)
+        if not any(math.isnan(v) for v in a) and not any(math.isnan(v) for v in b):
+            return "d"
+    return None
+
+
+# Visão tipada (e do tamanho certo) de um buffer compartilhado
+def _vista(buf, codigo, tamanho):
+    return memoryview(buf).cast("B").cast(codigo)[:tamanho]
+
+
+# Os buffers são arquivos temporários mapeados em memória (mmap), e cada
+# tarefa leva só os caminhos: assim o mesmo Pool serve para várias chamadas.
+# Um RawArray só chega aos workers pelo initializer (um Pool por chamada), e
+# o SharedMemory do Python < 3.13 registra o bloco no resource_tracker de
+# cada worker, que tenta apagá-lo de novo quando o worker termina.
+def _mapear(caminho):
+    with open(caminho, "r+b") as arq:
+        return mmap.mmap(arq.fileno(), 0)
+
+
+def _mesclar_fatia(tarefa):
+    caminhos, tamanhos, codigo, k0, k1 = tarefa
+    mapas = [_mapear(caminho) for caminho in caminhos]
+    a, b, saida = [_vista(mapa, codigo, t) for mapa, t in zip(mapas, tamanhos)]
+    try:
+        i0, i1 = co_rank(k0, a, b), co_rank(k1, a, b)
+        j0, j1 = k0 - i0, k1 - i1
+        fatia = merge(a[i0:i1].tolist(), b[j0:j1].tolist())
+        saida[k0:k1] = array(codigo, fatia)
+    finally:
+        # mmap.close() falha enquanto houver memoryview apontando para ele
+        for vista in (a, b, saida):
+            vista.release()
+        for mapa in mapas:
+            mapa.close()
+
+
+def merge_paralelo(left, right, p=None, pool=None):
+    """Mesmo resultado de merge(left, right), calculado por p processos.
+
+    Só listas de int (int64) ou float (sem NaN) usam o caminho paralelo;
+    qualquer outra coisa, ou entradas pequenas, caem no merge sequencial.
+
+    pool: um multiprocessing.Pool já aberto, reaproveitado entre chamadas
+    (sem ele cada chamada sobe e derruba um Pool próprio, e com "spawn" cada
+    worker reimporta este módulo). p é o número de fatias; o padrão é o
+    número de CPUs.
+    """
+    p = p or os.cpu_count() or 1
+    total = len(left) + len(right)
+    codigo = _codigo_tipo(left, right) if p > 1 and total >= MIN_PARALELO else None
+    if codigo is None:
+        return merge(left, right)
+
+    tamanhos = (len(left), len(right), total)
+    caminhos, mapas = [], []
+    try:
+        for t in tamanhos:
+            fd, caminho = tempfile.mkstemp(prefix="merge_paralelo_")
+            caminhos.append(caminho)
+            with open(fd, "r+b") as arq:
+                # mmap não aceita arquivo vazio
+                arq.truncate(max(1, t) * array(codigo).itemsize)
+            mapas.append(_mapear(caminho))
+        for mapa, valores in zip(mapas, (left, right)):
+            vista = _vista(mapa, codigo, len(valores))
+            vista[:] = array(codigo, valores)
+            vista.release()
+
+        cortes = [total * t // p for t in range(p + 1)]
+        tarefas = [(caminhos, tamanhos, codigo, k0, k1) for k0, k1 in zip(cortes, cortes[1:])]
+        if pool is None:
+            with Pool(p) as proprio:
+                proprio.map(_mesclar_fatia, tarefas)
+        else:
+            pool.map(_mesclar_fatia, tarefas)
+
+        saida = _vista(mapas[2], codigo, total)
+        resultado = saida.tolist()
+        saida.release()
+        return resultado
+    finally:
+        for mapa in mapas:
+            mapa.close()
+        for caminho in caminhos:
+            os.remove(caminho)
+
+
+# ===============================================================
+# BENCHMARK DE ESCALABILIDADE
+# ===============================================================
+
+def benchmark_merge_paralelo(n=1_000_000, rep=5, processos=None):
+    """Mede merge vs merge_paralelo para duas runs ordenadas de n elementos cada."""
+    if processos is None:
+        maximo = os.cpu_count() or 1
+        processos = [p for p in (1, 2, 4, 8, 16, 32) if p <= maximo]
+
+    left = sorted(random.randint(0, 1_000_000) for _ in range(n))
+    right = sorted(random.randint(0, 1_000_000) for _ in range(n))
+
+    esperado = merge(left, right)
+    base = statistics.median(tempo(lambda arr: merge(arr, right), left) for _ in range(rep))
+    print(f"merge sequencial ({2 * n} elementos): {base / 1e6:.1f} ms")
+
+    # linha de referência: merge sequencial, com 1 processo (speedup 1.0 por definição)
+    linhas = [["merge (baseline)", 1, base, 1.0]]
+    for p in processos:
+        if p == 1:
+            # merge_paralelo com um processo é o próprio merge: já é a linha acima
+            continue
+        # um Pool por p, reaproveitado nas repetições: mede o merge, não a subida dos workers
+        with Pool(p) as pool:
+            resultado = merge_paralelo(left, right, p, pool)
+            assert resultado == esperado, f"merge_paralelo(p={p}) difere de merge"
+            mediana = statistics.median(
+                tempo(lambda arr: merge_paralelo(arr, right, p, pool), left) for _ in range(rep))
+        speedup = base / mediana
+        print(f"merge_paralelo p={p:2d}: {mediana / 1e6:9.1f} ms  speedup={speedup:5.2f}x")
+        linhas.append(["merge_paralelo", p, mediana, speedup])
+
+    csv_path = os.path.join(FIGS_DIR, "merge_paralelo.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.writer(cf)
+        writer.writerow(["algoritmo", "processos", "mediana_ns", "speedup"])
+        writer.writerows(linhas)
+    print(f"\nResultados salvos em: {os.path.abspath(csv_path)}")
+
+
+if __name__ == "__main__":
+    benchmark_merge_paralelo()
@@ -0,0 +1,568 @@
+import os
+import csv
+import json
+import random
+import statistics
+import operator
+from itertools import islice
+
+import numpy as np
+
+from analiseAlg import FIGS_DIR, insertion_sort, hybrid_sort, merge, counting_sort, tempo, find_n0
+
+# ===============================================================
+# 1. MOTORES DE ORDENAÇÃO
+# ===============================================================
+
+LIMIARES_PATH = os.path.join(FIGS_DIR, "limiares_smart_sort.json")
+CALIBRACAO_PATH = os.path.join(FIGS_DIR, "calibracao_smart_sort.csv")
+
+
+# Merge natural (adaptativo): aproveita as sequências já ordenadas da entrada.
+# Sequências estritamente decrescentes são invertidas (estrito para manter
+# a estabilidade) e depois os runs são intercalados dois a dois com merge().
+def natural_merge_sort(arr):
+    n = len(arr)
+    if n <= 1:
+        return list(arr)
+
+    runs = []
+    i = 0
+    while i < n:
+        j = i + 1
+        if j < n and arr[j] < arr[i]:
+            while j < n and arr[j] < arr[j - 1]:
+                j += 1
+            run = arr[i:j]
+            run.reverse()
+        else:
+            while j < n and arr[j] >= arr[j - 1]:
+                j += 1
+            run = arr[i:j]
+        runs.append(run)
+        i = j
+
+    while len(runs) > 1:
+        proximos = [merge(runs[k], runs[k + 1]) for k in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            proximos.append(runs[-1])
+        runs = proximos
+    return runs[0]
+
+
+# Ordenação vetorizada com numpy (somente chaves numéricas homogêneas).
+# O dtype tem que representar exatamente o único tipo Python da entrada:
+# int misturado com float vira float64 (e perde precisão), e inteiros fora
+# de int64 viram uint64 ou object
+def vectorized_sort(arr, n0=32):
+    tipos = set(map(type, arr))
+    if tipos == {int}:
+        tipo_esperado = "i"
+    elif tipos == {float}:
+        tipo_esperado = "f"
+    else:
+        return hybrid_sort(arr, n0)
+    try:
+        vetor = np.asarray(arr)
+    except (ValueError, OverflowError):
+        return hybrid_sort(arr, n0)
+    if vetor.dtype.kind != tipo_esperado:
+        return hybrid_sort(arr, n0)
+    return np.sort(vetor, kind="stable").tolist()
+
+
+# Counting sort quando a faixa de valores é pequena (muitos duplicados);
+# faixa grande ou chaves não inteiras caem no híbrido
+def contagem_sort(arr, n0=32):
+    try:
+        return counting_sort(arr, max_amplitude=max(1024, 4 * len(arr)))
+    except (ValueError, TypeError):
+        return hybrid_sort(arr, n0)
+
+
+# ===============================================================
+# 2. PERFIL DA ENTRADA (amostragem barata)
+# ===============================================================
+
+def perfil_entrada(arr, amostra=128):
+    """Estima tamanho, desordem, tipo e duplicados da entrada.
+
+    Olha uma amostra de passo fixo (fatiamento, barato) começando no meio
+    do primeiro passo. Não há nada aleatório: a mesma entrada sempre gera o
+    mesmo perfil.
+
+    - descidas: nº de pares vizinhos com arr[i] > arr[i+1] (= runs - 1;
+      0 = ordenado, n - 1 = estritamente decrescente; vê desordem local),
+      estimado pela amostra. Nos extremos a amostra não distingue
+      "ordenado" de "quase ordenado": ver _contar_descidas
+    - frac_descidas: descidas / (n - 1)
+    - frac_inversoes: fração de pares distantes (>= um passo) invertidos
+      (0 = ordenado, 0.5 = aleatório, 1 = invertido; cego a desordem local)
+    - tipo: "int", "float" ou "misto" (int com float também é "misto")
+    - taxa_duplicados: 1 - distintos / tamanho da amostra
+    - amplitude_relativa: (max - min) / n da amostra, só para inteiros
+      (faixa pequena favorece counting sort mesmo sem duplicados)
+    """
+    n = len(arr)
+    if n < 2:
+        return {"n": n, "descidas": 0, "frac_descidas": 0.0, "frac_inversoes": 0.0,
+                "tipo": "int", "taxa_duplicados": 0.0, "amplitude_relativa": 0.0}
+
+    passo = max(1, (n - 1) // amostra)
+    inicio = passo // 2
+
+    atuais = arr[inicio:n - 1:passo]
+    seguintes = arr[inicio + 1::passo]
+    descidas = sum(1 for x, y in zip(atuais, seguintes) if x > y)
+    descidas = round(descidas / len(atuais) * (n - 1))
+
+    valores = atuais
+
+    # pares a meia amostra de distância (longo alcance) e a um passo (curto)
+    meio = max(1, len(valores) // 2)
+    inversoes = sum(1 for x, y in zip(valores, valores[meio:]) if x > y)
+    inversoes += sum(1 for x, y in zip(valores, valores[1:]) if x > y)
+    pares = max(1, len(valores) - meio) + max(1, len(valores) - 1)
+
+    tipos = set(map(type, valores))
+    if tipos == {int}:
+        tipo = "int"
+    elif tipos == {float}:
+        tipo = "float"
+    else:
+        tipo = "misto"
+
+    return {
+        "n": n,
+        "descidas": descidas,
+        "frac_descidas": descidas / (n - 1),
+        "frac_inversoes": inversoes / pares,
+        "tipo": tipo,
+        "taxa_duplicados": 1 - len(set(valores)) / len(valores),
+        "amplitude_relativa": (max(valores) - min(valores)) / n if tipo == "int" else float("inf"),
+    }
+
+
+def _contar_descidas(arr, perfil):
+    """Troca a estimativa de descidas pela contagem exata (laço em C)."""
+    perfil["descidas"] = sum(map(operator.gt, arr, islice(arr, 1, None)))
+    perfil["frac_descidas"] = perfil["descidas"] / (perfil["n"] - 1)
+
+
+# ===============================================================
+# 3. LIMIARES (aprendidos por calibrar())
+# ===============================================================
+#
+# Cada limiar existe em duas versões: sem sufixo (motor vetorizado fora de
+# jogo: chaves não numéricas ou n pequeno) e com "_vet"
+# (aprendido contra todos os motores, inclusive o vetorizado).
+#
+# Valores desligados: -1 para limites "<=" (nenhuma feature é negativa) e
+# 2.0 para limites ">=" (taxa_duplicados nunca passa de 1).
+#
+# As features foram escolhidas para o limiar não depender de n: insertion
+# usa a contagem absoluta de descidas (o custo extra cresce com o nº de
+# itens fora do lugar, não com a fração), runs usa a fração (merge natural
+# compensa enquanto runs/n for pequeno) e contagem usa a faixa relativa a n.
+
+# Valores de reserva, usados só enquanto figs/limiares_smart_sort.json
+# não existir. Rode este arquivo (ou calibrar()) para aprendê-los na máquina.
+LIMIARES_PADRAO = {
+    "n0": 32,
+    "n_insercao": 32,
+    "n_vetorizado": 256,
+    "inversoes_insercao": 0.001,
+    "descidas_insercao": 4,
+    "descidas_runs": 0.01,
+    "duplicados_contagem": 2.0,
+    "amplitude_contagem": -1.0,
+    "inversoes_insercao_vet": -1.0,
+    "descidas_insercao_vet": -1.0,
+    "descidas_runs_vet": -1.0,
+    "duplicados_contagem_vet": 2.0,
+    "amplitude_contagem_vet": -1.0,
+}
+
+# smart_sort não pode ficar mais lento que isso em relação ao melhor motor
+# (usado pela calibração e pelo benchmark)
+RAZAO_MAXIMA = 1.5
+
+# folga mínima (relativa) entre um limiar e o caso de calibração mais
+# próximo do outro lado
+MARGEM = 0.2
+
+_limiares_cache = None
+
+
+def carregar_limiares(path=LIMIARES_PATH):
+    global _limiares_cache
+    if _limiares_cache is None:
+        limiares = dict(LIMIARES_PADRAO)
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as jf:
+                limiares.update(json.load(jf))
+        _limiares_cache = limiares
+    return _limiares_cache
+
+
+def _vetorizado_disponivel(perfil, limiares):
+    return perfil["tipo"] != "misto" and perfil["n"] >= limiares["n_vetorizado"]
+
+
+def escolher_motor(perfil, limiares):
+    n = perfil["n"]
+    if n <= limiares["n_insercao"]:
+        return "insertion"
+
+    vetor = _vetorizado_disponivel(perfil, limiares)
+    sufixo = "_vet" if vetor else ""
+    d = perfil["frac_descidas"]
+
+    # quase ordenado: insertion é O(n + inversões). frac_inversoes só vê
+    # pares a um passo ou mais de distância, então desordem local (blocos
+    # embaralhados) tem que aparecer nas descidas também
+    if (perfil["frac_inversoes"] <= limiares["inversoes_insercao" + sufixo]
+            and perfil["descidas"] <= limiares["descidas_insercao" + sufixo]):
+        return "insertion"
+
+    # poucos runs (crescentes ou decrescentes): merge natural é ~O(n log runs)
+    if min(d, 1 - d) <= limiares["descidas_runs" + sufixo]:
+        return "runs"
+
+    # chaves inteiras com muitos duplicados ou faixa de valores pequena
+    if perfil["tipo"] == "int" and (
+            perfil["taxa_duplicados"] >= limiares["duplicados_contagem" + sufixo]
+            or perfil["amplitude_relativa"] <= limiares["amplitude_contagem" + sufixo]):
+        return "contagem"
+
+    if vetor:
+        return "vetorizado"
+
+    return "hibrido"
+
+
+# Confirmação exata (laço em C, para no primeiro par fora de ordem)
+def _ordenado(arr, comparar):
+    return all(map(comparar, arr, islice(arr, 1, None)))
+
+
+def _motor_para(arr, limiares):
+    perfil = perfil_entrada(arr)
+    n = perfil["n"]
+    if perfil["descidas"] in (0, n - 1):
+        # a amostra não viu nenhuma descida (ou só descidas): pode ser
+        # ordenado, estritamente decrescente (inverter mantém a
+        # estabilidade) ou quase isso
+        if _ordenado(arr, operator.le):
+            return "ja_ordenado"
+        if _ordenado(arr, operator.gt):
+            return "inverter"
+        # quase: insertion e runs dependem da contagem exata, que só vale
+        # a pena fazer se alguma das duas regras estiver ligada
+        sufixo = "_vet" if _vetorizado_disponivel(perfil, limiares) else ""
+        if max(limiares["descidas_insercao" + sufixo], limiares["descidas_runs" + sufixo]) >= 0:
+            _contar_descidas(arr, perfil)
+    return escolher_motor(perfil, limiares)
+
+
+def smart_sort(arr, limiares=None):
+    """Ordena escolhendo o motor a partir de um perfil amostrado da entrada."""
+    limiares = limiares or carregar_limiares()
+    motor = _motor_para(arr, limiares)
+    return MOTORES[motor](arr, limiares["n0"])
+
+
+MOTORES = {
+    "insertion": lambda arr, n0: insertion_sort(arr),
+    "hibrido": hybrid_sort,
+    "runs": lambda arr, n0: natural_merge_sort(arr),
+    "contagem": contagem_sort,
+    "vetorizado": vectorized_sort,
+    "ja_ordenado": lambda arr, n0: list(arr),
+    "inverter": lambda arr, n0: arr[::-1],
+}
+
+# só valem depois da confirmação exata em _motor_para, não são motores gerais
+ATALHOS = {"ja_ordenado", "inverter"}
+
+
+# ===============================================================
+# 4. CALIBRAÇÃO (aprende os limiares a partir de medições)
+# ===============================================================
+
+def _mediana_tempo(func, arr, rep):
+    # mediana: menos sensível a pausas do SO do que a média
+    return statistics.median(tempo(func, arr) for _ in range(rep))
+
+
+def _tempos_motores(motores, arr, rep):
+    """Mediana de cada motor em arr.
+
+    Motor que já fica muito atrás do melhor na primeira medida (ex.:
+    insertion em dados aleatórios) não precisa das repetições: basta saber
+    que perde.
+    """
+    primeira = {m: tempo(f, arr) for m, f in motores.items()}
+    melhor = min(primeira.values())
+    return {m: (_mediana_tempo(f, arr, rep) if primeira[m] <= 2 * RAZAO_MAXIMA * melhor
+                else primeira[m])
+            for m, f in motores.items()}
+
+
+# ordenado com algumas trocas de posições aleatórias (longo alcance)
+def _quase_ordenado(n, trocas):
+    arr = list(range(n))
+    for _ in range(trocas):
+        i, j = random.randrange(n), random.randrange(n)
+        arr[i], arr[j] = arr[j], arr[i]
+    return arr
+
+
+# ordenado por blocos, mas cada bloco embaralhado (desordem só local)
+def _blocos_embaralhados(n, bloco):
+    arr = list(range(n))
+    for i in range(0, n, bloco):
+        pedaco = arr[i:i + bloco]
+        random.shuffle(pedaco)
+        arr[i:i + bloco] = pedaco
+    return arr
+
+
+def _com_runs(n, runs):
+    arr = []
+    tam = max(1, n // runs)
+    while len(arr) < n:
+        arr.extend(sorted(random.randint(0, 1_000_000) for _ in range(min(tam, n - len(arr)))))
+    return arr
+
+
+def _casos_calibracao(n):
+    casos = []
+    for trocas in [0, 1, 2, 4, 8, 16, 32, 64, n // 4]:
+        casos.append(("quase_ordenado", trocas, _quase_ordenado(n, trocas)))
+    for bloco in [2, 4, 16, 64, 256]:
+        casos.append(("blocos_embaralhados", bloco, _blocos_embaralhados(n, bloco)))
+    # (runs = n equivale a dados aleatórios)
+    for runs in [1, 2, 4, 16, 64, 256, n // 4, n]:
+        casos.append(("runs", runs, _com_runs(n, runs)))
+    for distintos in [2, 10, 100, n // 10]:
+        casos.append(("poucos_distintos", distintos, [random.randrange(distintos) for _ in range(n)]))
+    # faixa de valores = fator * n (onde counting deixa de compensar)
+    for fator in [1, 2, 4, 8, 32]:
+        casos.append(("faixa", fator, [random.randrange(fator * n) for _ in range(n)]))
+    return casos
+
+
+def _limiar_seguro(casos, motores, motor, chaves, menor_igual=True):
+    """Limiares para as features em "chaves" a partir dos casos que "motor" venceu.
+
+    Vai ampliando a região (feature <= limiar, ou >= se menor_igual=False)
+    caso a caso, e para assim que ela englobar algum caso de calibração em
+    que o motor fica mais de RAZAO_MAXIMA vezes atrás do melhor.
+
+    Das regiões seguras fica a maior que tenha folga (MARGEM) até o próximo
+    caso de fora, e o limiar vai para o meio dessa folga: entradas parecidas
+    com as da calibração não caem dos dois lados dele por causa de ruído.
+    """
+    vencedores = [p for p, t in casos if min(motores, key=t.get) == motor]
+    sinal = 1 if menor_igual else -1
+    vencedores.sort(key=lambda p: [sinal * f(p) for f in chaves])
+    agregar = max if menor_igual else min
+
+    seguros = []
+    for k in range(1, len(vencedores) + 1):
+        candidato = [agregar(f(p) for p in vencedores[:k]) for f in chaves]
+        dentro = [t for p, t in casos if _na_regiao(p, chaves, candidato, menor_igual)]
+        if any(t[motor] > RAZAO_MAXIMA * min(t[m] for m in motores) for t in dentro):
+            break
+        seguros.append(candidato)
+
+    for candidato in reversed(seguros):
+        limiar = []
+        for c, f in zip(candidato, chaves):
+            de_fora = [f(p) for p, _ in casos if sinal * f(p) > sinal * c]
+            if not de_fora:
+                limiar.append(c)
+                continue
+            proximo = min(de_fora, key=lambda v: sinal * v)
+            if abs(proximo - c) < MARGEM * max(abs(proximo), abs(c)):
+                break
+            # nenhum caso de calibração fica entre c e proximo
+            limiar.append((c + proximo) / 2)
+        else:
+            return limiar
+    return [-1.0 if menor_igual else 2.0] * len(chaves)  # desligado
+
+
+def _na_regiao(perfil, chaves, limiar, menor_igual=True):
+    if menor_igual:
+        return all(f(perfil) <= c for f, c in zip(chaves, limiar))
+    return all(f(perfil) >= c for f, c in zip(chaves, limiar))
+
+
+def _aprender(casos, motores):
+    """Limiares de cada regra, na mesma ordem em que escolher_motor as aplica.
+
+    Casos já capturados por uma regra anterior não contam para as seguintes.
+    """
+    restantes = list(casos)
+
+    def aprender(motor, chaves, menor_igual=True, familia=None):
+        nonlocal restantes
+        candidatos = [(p, t) for f, p, t in restantes if familia is None or f == familia]
+        limiar = _limiar_seguro(candidatos, motores, motor, chaves, menor_igual)
+        restantes = [(f, p, t) for f, p, t in restantes
+                     if not _na_regiao(p, chaves, limiar, menor_igual)]
+        return limiar
+
+    descidas, inversoes = aprender(
+        "insertion", [lambda p: p["descidas"], lambda p: p["frac_inversoes"]])
+    runs, = aprender("runs", [lambda p: min(p["frac_descidas"], 1 - p["frac_descidas"])])
+    # duplicados só fazem sentido na família que varia a quantidade de distintos;
+    # permutações de range(n) favorecem counting pela faixa, não por duplicados
+    duplicados, = aprender("contagem", [lambda p: p["taxa_duplicados"]],
+                           menor_igual=False, familia="poucos_distintos")
+    amplitude, = aprender("contagem", [lambda p: p["amplitude_relativa"]])
+    return {
+        "inversoes_insercao": inversoes,
+        "descidas_insercao": descidas,
+        "descidas_runs": runs,
+        "duplicados_contagem": duplicados,
+        "amplitude_contagem": amplitude,
+    }
+
+
+def calibrar(n=(1000, 5000), rep=5, salvar=True):
+    """Mede todos os motores em entradas controladas e grava os limiares aprendidos.
+
+    n: tamanho (ou tamanhos) das entradas de calibração. Use a faixa de
+    tamanhos que o smart_sort vai ordenar: os limiares aprendidos têm que
+    valer em todos eles ao mesmo tempo.
+    """
+    tamanhos = [n] if isinstance(n, int) else list(n)
+    medicoes = []
+
+    n0 = find_n0(limit=200, rep=rep * 4) or LIMIARES_PADRAO["n0"]
+    limiares = {"n0": n0}
+    motores = {nome: (lambda a, f=f: f(a, n0)) for nome, f in MOTORES.items()
+               if nome not in ATALHOS}
+    genericos = [m for m in motores if m != "vetorizado"]
+
+    # tamanhos pequenos (dados aleatórios): até onde insertion vence e a
+    # partir de onde o numpy (com conversão de ida e volta) compensa
+    limiares["n_insercao"] = 0
+    limiares["n_vetorizado"] = float("inf")
+    for tam in [8, 16, 32, 64, 128, 256, 512, 1024]:
+        arr = [random.randint(0, 1_000_000) for _ in range(tam)]
+        tempos = {m: _mediana_tempo(f, arr, rep) for m, f in motores.items()}
+        for m, t in tempos.items():
+            medicoes.append(["tamanho", tam, tam, m, 0.5, t])
+        if min(motores, key=tempos.get) == "insertion":
+            limiares["n_insercao"] = tam
+        if limiares["n_vetorizado"] == float("inf"):
+            if tempos["vetorizado"] < min(tempos[m] for m in genericos):
+                limiares["n_vetorizado"] = tam
+
+    # formatos de entrada: cada motor contra todos os outros
+    casos = []
+    for tam in tamanhos:
+        for familia, parametro, arr in _casos_calibracao(tam):
+            # mesmo perfil que smart_sort calcula, para os limiares valerem na prática
+            perfil = perfil_entrada(arr)
+            if perfil["descidas"] in (0, tam - 1):
+                _contar_descidas(arr, perfil)
+                if perfil["descidas"] in (0, tam - 1):
+                    continue  # ordenado / invertido: resolvidos antes das regras
+            tempos = _tempos_motores(motores, arr, rep)
+            casos.append((familia, perfil, tempos))
+            for m, t in tempos.items():
+                medicoes.append([familia, parametro, tam, m, perfil["frac_descidas"], t])
+
+    limiares.update(_aprender(casos, genericos))
+    for chave, valor in _aprender(casos, list(motores)).items():
+        limiares[chave + "_vet"] = valor
+
+    if salvar:
+        with open(LIMIARES_PATH, "w", encoding="utf-8") as jf:
+            json.dump(limiares, jf, indent=2)
+        print(f"Limiares salvos em: {os.path.abspath(LIMIARES_PATH)}")
+
+        with open(CALIBRACAO_PATH, "w", newline="", encoding="utf-8") as cf:
+            writer = csv.writer(cf)
+            writer.writerow(["experimento", "parametro", "n", "motor", "frac_descidas", "tempo_ns"])
+            writer.writerows(medicoes)
+        print(f"Medições da calibração salvas em: {os.path.abspath(CALIBRACAO_PATH)}")
+
+        global _limiares_cache
+        _limiares_cache = None
+
+    return limiares
+
+
+# ===============================================================
+# 5. BENCHMARK: smart_sort vs cada algoritmo isolado
+# ===============================================================
+
+def distribuicoes(n):
+    return {
+        "ordenados": list(range(n)),
+        "inversos": list(range(n, 0, -1)),
+        "aleatorios": [random.randint(0, 1_000_000) for _ in range(n)],
+        "quase_ordenados": _quase_ordenado(n, 4),
+        "blocos_embaralhados": _blocos_embaralhados(n, 500),
+        "poucos_runs": _com_runs(n, 8),
+        "poucos_distintos": [random.randint(0, 9) for _ in range(n)],
+        # int com float: virar float64 no numpy mudaria os valores
+        "inteiros_e_float": [random.randint(2 ** 60, 2 ** 60 + n) for _ in range(n - 1)] + [0.5],
+    }
+
+
+def benchmark_smart_sort(n=5000, rep=11, razao_maxima=RAZAO_MAXIMA):
+    limiares = carregar_limiares()
+    n0 = limiares["n0"]
+    algoritmos = {nome: (lambda a, f=f: f(a, n0)) for nome, f in MOTORES.items()
+                  if nome not in ATALHOS}
+    algoritmos["smart"] = lambda a: smart_sort(a, limiares)
+
+    linhas = []
+    falhas = []
+    for nome_dist, arr in distribuicoes(n).items():
+        esperado = sorted(arr)
+        for nome_alg, func in algoritmos.items():
+            assert func(arr) == esperado, f"{nome_alg} ordenou errado em {nome_dist}"
+
+        # rodadas intercaladas: uma pausa do SO ou mudança de frequência da
+        # CPU pega a rodada inteira, não só o algoritmo medido naquele momento
+        tempos = {nome_alg: [] for nome_alg in algoritmos}
+        for _ in range(rep):
+            for nome_alg, func in algoritmos.items():
+                tempos[nome_alg].append(tempo(func, arr))
+        medianas = {nome_alg: statistics.median(t) for nome_alg, t in tempos.items()}
+
+        melhor = min((a for a in medianas if a != "smart"), key=medianas.get)
+        # razão pareada (mesma rodada) para o ruído entre rodadas se cancelar
+        razao = statistics.median(s / m for s, m in zip(tempos["smart"], tempos[melhor]))
+        motor = _motor_para(arr, limiares)
+        print(f"{nome_dist:20s} smart={medianas['smart'] / 1e6:9.3f} ms (motor={motor:10s})  "
+              f"melhor={melhor:10s} {medianas[melhor] / 1e6:9.3f} ms  razão={razao:5.2f}x")
+        for nome_alg, mediana in medianas.items():
+            linhas.append([nome_dist, nome_alg, mediana, razao if nome_alg == "smart" else ""])
+        if razao > razao_maxima:
+            falhas.append(f"{nome_dist}: {razao:.2f}x (motor={motor}, melhor={melhor})")
+
+    csv_path = os.path.join(FIGS_DIR, "benchmark_smart_sort.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.writer(cf)
+        writer.writerow(["distribuicao", "algoritmo", "mediana_ns", "razao_smart_melhor"])
+        writer.writerows(linhas)
+    print(f"\nBenchmark salvo em: {os.path.abspath(csv_path)}")
+
+    assert not falhas, f"smart_sort acima de {razao_maxima}x do melhor motor em: " + "; ".join(falhas)
+
+
+if __name__ == "__main__":
+    print("Calibrando limiares do smart_sort...\n")
+    print(calibrar())
+
+    print("\n=== smart_sort vs melhor algoritmo isolado ===\n")
+    benchmark_smart_sort()
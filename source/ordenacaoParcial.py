@@ -0,0 +1,137 @@
+import os
+import csv
+import heapq
+import random
+import statistics
+from itertools import islice
+
+from analiseAlg import FIGS_DIR, hybrid_sort, tempo
+
+# ===============================================================
+# ORDENAÇÃO PARCIAL (top-k) E ORDENAÇÃO SOB DEMANDA
+# ===============================================================
+#
+# Quando só os k menores (ou a primeira página) interessam, ordenar tudo
+# custa O(n log n) à toa:
+#   - top_k: heap máximo limitado a k itens, O(n log k)
+#   - iter_sorted: heapify O(n) e cada próximo item em O(log n)
+#   - merge_lazy: versão geradora de merge(), só avança o que for consumido
+#
+# Empates seguem a ordem de entrada (índice como desempate), então os
+# resultados são iguais a hybrid_sort(arr, n0)[:k].
+
+_FIM = object()
+
+
+# Versão preguiçosa de merge(left, right): aceita iteradores e só consome
+# o necessário para produzir o próximo item (empates vão para left)
+def merge_lazy(left, right):
+    left, right = iter(left), iter(right)
+    x, y = next(left, _FIM), next(right, _FIM)
+
+    while x is not _FIM and y is not _FIM:
+        if x <= y:
+            yield x
+            x = next(left, _FIM)
+        else:
+            yield y
+            y = next(right, _FIM)
+
+    if x is not _FIM:
+        yield x
+        yield from left
+    if y is not _FIM:
+        yield y
+        yield from right
+
+
+def merge_lazy_varias(runs):
+    """Intercala preguiçosamente várias runs ordenadas (árvore de merge_lazy)."""
+    runs = list(runs)
+    if not runs:
+        return iter(())
+    if len(runs) == 1:
+        return iter(runs[0])
+    mid = len(runs) // 2
+    return merge_lazy(merge_lazy_varias(runs[:mid]), merge_lazy_varias(runs[mid:]))
+
+
+# Heap máximo sobre pares (valor, índice): o topo é o pior dos k atuais
+def _descer_max(heap, i):
+    n = len(heap)
+    item = heap[i]
+    while True:
+        filho = 2 * i + 1
+        if filho >= n:
+            break
+        if filho + 1 < n and heap[filho + 1] > heap[filho]:
+            filho += 1
+        if heap[filho] <= item:
+            break
+        heap[i] = heap[filho]
+        i = filho
+    heap[i] = item
+
+
+def top_k(arr, k, n0=32):
+    """Os k menores itens de arr, em ordem (igual a hybrid_sort(arr, n0)[:k])."""
+    if k <= 0:
+        return []
+    if k >= len(arr):
+        return hybrid_sort(arr, n0)
+
+    heap = [(x, i) for i, x in enumerate(arr[:k])]
+    for i in range(k // 2 - 1, -1, -1):
+        _descer_max(heap, i)
+
+    for i in range(k, len(arr)):
+        x = arr[i]
+        # estrito: em empate o item que já está no heap veio antes
+        if x < heap[0][0]:
+            heap[0] = (x, i)
+            _descer_max(heap, 0)
+
+    return [x for x, _ in hybrid_sort(heap, n0)]
+
+
+def iter_sorted(arr):
+    """Gera os itens de arr em ordem crescente, sob demanda."""
+    # heapq (min-heap em C); o índice desempata e mantém a estabilidade
+    heap = [(x, i) for i, x in enumerate(arr)]
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[0]
+
+
+# ===============================================================
+# BENCHMARK: k << n vs hybrid_sort completo
+# ===============================================================
+
+def benchmark_parcial(n=100_000, ks=(1, 10, 100, 1000), rep=5, n0=32):
+    arr = [random.randint(0, 1_000_000) for _ in range(n)]
+    base = statistics.median(tempo(lambda a: hybrid_sort(a, n0), arr) for _ in range(rep))
+    completo = hybrid_sort(arr, n0)
+    print(f"hybrid_sort completo (n={n}): {base / 1e6:.1f} ms\n")
+
+    linhas = [["hybrid_sort", n, n, base, 1.0]]
+    for k in ks:
+        assert top_k(arr, k, n0) == completo[:k]
+        assert list(islice(iter_sorted(arr), k)) == completo[:k]
+
+        t_top = statistics.median(tempo(lambda a: top_k(a, k, n0), arr) for _ in range(rep))
+        t_iter = statistics.median(tempo(lambda a: list(islice(iter_sorted(a), k)), arr) for _ in range(rep))
+        print(f"k={k:6d}  top_k={t_top / 1e6:8.2f} ms ({base / t_top:5.1f}x)  "
+              f"iter_sorted={t_iter / 1e6:8.2f} ms ({base / t_iter:5.1f}x)")
+        linhas.append(["top_k", n, k, t_top, base / t_top])
+        linhas.append(["iter_sorted", n, k, t_iter, base / t_iter])
+
+    csv_path = os.path.join(FIGS_DIR, "ordenacao_parcial.csv")
+    with open(csv_path, "w", newline="", encoding="utf-8") as cf:
+        writer = csv.writer(cf)
+        writer.writerow(["algoritmo", "n", "k", "mediana_ns", "speedup_vs_hybrid"])
+        writer.writerows(linhas)
+    print(f"\nResultados salvos em: {os.path.abspath(csv_path)}")
+
+
+if __name__ == "__main__":
+    benchmark_parcial()
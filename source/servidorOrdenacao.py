@@ -0,0 +1,321 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from analiseAlg import hybrid_sort
+
+# ===============================================================
+# SERVIDOR DE ORDENAÇÃO (asyncio + pool de processos)
+# ===============================================================
+#
+# Protocolo: uma linha JSON por pedido, uma linha JSON por resposta.
+#   pedido:   {"id": 1, "dados": [5, 3, 9]}
+#   resposta: {"id": 1, "resultado": [3, 5, 9]}  ou  {"id": 1, "erro": "..."}
+#
+# O trabalho de CPU (hybrid_sort) roda num ProcessPoolExecutor, então o
+# event loop nunca bloqueia. Pedidos pequenos são agrupados em micro-lotes:
+# vários pedidos viajam juntos numa única ida e volta ao worker. Linhas
+# grandes vão inteiras para o worker (json.loads, ordenação e json.dumps lá),
+# para que nem o parse nem a serialização segurem o event loop.
+
+HOST = "127.0.0.1"
+PORTA = 8765
+N0_PADRAO = 32
+
+LOTE_MAX_PEDIDOS = 64          # máximo de pedidos por lote
+LOTE_MAX_ELEMENTOS = 20_000    # soma dos tamanhos num lote; acima disso vai sozinho
+LOTE_ESPERA_S = 0.002          # quanto esperar por mais pedidos antes de despachar
+
+LIMITE_LINHA = 64 * 1024 * 1024  # tamanho máximo de uma linha JSON (bytes)
+LINHA_NO_LOOP = 64 * 1024        # acima disso o JSON é tratado no worker
+MAX_PEDIDOS_CONEXAO = 256        # pedidos em andamento por conexão
+
+
+# Executado no worker: ordena todas as listas do lote numa única chamada
+def _ordenar_lote(listas, n0):
+    resultados = []
+    for dados in listas:
+        try:
+            resultados.append(("ok", hybrid_sort(dados, n0)))
+        except TypeError as e:
+            # elementos não comparáveis (ex.: número misturado com string)
+            resultados.append(("erro", str(e)))
+    return resultados
+
+
+def _validar(pedido):
+    if not isinstance(pedido, dict):
+        raise ValueError("pedido deve ser um objeto JSON")
+    dados = pedido.get("dados")
+    if not isinstance(dados, list):
+        raise ValueError("campo 'dados' deve ser uma lista")
+    return dados
+
+
+def _linha_resposta(id_pedido, status, valor):
+    chave = "resultado" if status == "ok" else "erro"
+    return (json.dumps({"id": id_pedido, chave: valor}) + "\n").encode("utf-8")
+
+
+# Executado no worker: pedido grande do começo ao fim (bytes -> bytes)
+def _processar_linha(linha, n0):
+    id_pedido = None
+    try:
+        pedido = json.loads(linha)
+        if isinstance(pedido, dict):
+            id_pedido = pedido.get("id")
+        (status, valor), = _ordenar_lote([_validar(pedido)], n0)
+    except (ValueError, TypeError) as e:
+        # JSONDecodeError é subclasse de ValueError
+        status, valor = "erro", str(e)
+    return _linha_resposta(id_pedido, status, valor)
+
+
+def _falhar(lote, erro):
+    for _, fut in lote:
+        if not fut.done():
+            fut.set_exception(erro)
+
+
+class MicroLote:
+    """Agrupa pedidos pequenos e envia cada lote ao pool numa única chamada."""
+
+    def __init__(self, executor, n0=N0_PADRAO, max_pedidos=LOTE_MAX_PEDIDOS,
+                 max_elementos=LOTE_MAX_ELEMENTOS, espera=LOTE_ESPERA_S, lotes_em_voo=None):
+        self.executor = executor
+        self.n0 = n0
+        self.max_pedidos = max_pedidos
+        self.max_elementos = max_elementos
+        self.espera = espera
+        self.fila = asyncio.Queue()
+        # limita lotes simultâneos ao nº de workers, para a fila acumular
+        # pedidos enquanto os workers estão ocupados (lotes maiores sob carga)
+        self.em_voo = asyncio.Semaphore(lotes_em_voo or os.cpu_count() or 1)
+        self._tarefa = None
+        self._parado = False
+        self.lotes = 0
+        self.pedidos = 0
+
+    def iniciar(self):
+        self._tarefa = asyncio.create_task(self._despachar())
+
+    async def parar(self):
+        self._parado = True
+        if self._tarefa is not None:
+            self._tarefa.cancel()
+            try:
+                await self._tarefa
+            except asyncio.CancelledError:
+                pass
+        # quem ainda está na fila recebe erro em vez de esperar para sempre
+        restantes = []
+        while not self.fila.empty():
+            restantes.append(self.fila.get_nowait())
+        _falhar(restantes, RuntimeError("servidor encerrado"))
+
+    async def processar_linha(self, linha):
+        """Linha JSON grande: parse, ordenação e serialização no pool."""
+        if self._parado:
+            raise RuntimeError("servidor encerrado")
+        loop = asyncio.get_running_loop()
+        async with self.em_voo:
+            resposta = await loop.run_in_executor(self.executor, _processar_linha, linha, self.n0)
+        self.lotes += 1
+        self.pedidos += 1
+        return resposta
+
+    async def ordenar(self, dados):
+        if self._parado:
+            raise RuntimeError("servidor encerrado")
+        loop = asyncio.get_running_loop()
+
+        # pedido grande: não compensa esperar por outros, vai direto ao pool
+        if len(dados) >= self.max_elementos:
+            async with self.em_voo:
+                (status, valor), = await loop.run_in_executor(
+                    self.executor, _ordenar_lote, [dados], self.n0)
+            self.lotes += 1
+            self.pedidos += 1
+            return status, valor
+
+        fut = loop.create_future()
+        await self.fila.put((dados, fut))
+        return await fut
+
+    async def _despachar(self):
+        loop = asyncio.get_running_loop()
+        pendentes = set()
+        lote = []
+        try:
+            while True:
+                primeiro = await self.fila.get()
+                lote = [primeiro]
+                total = len(primeiro[0])
+                prazo = loop.time() + self.espera
+
+                while len(lote) < self.max_pedidos and total < self.max_elementos:
+                    restante = prazo - loop.time()
+                    if restante <= 0:
+                        break
+                    item = await self._proximo(restante)
+                    if item is None:
+                        break
+                    lote.append(item)
+                    total += len(item[0])
+
+                await self.em_voo.acquire()
+                tarefa = asyncio.create_task(self._executar(lote))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+                lote = []
+        finally:
+            # lote ainda sendo montado quando o despachante foi cancelado
+            _falhar(lote, RuntimeError("servidor encerrado"))
+            for tarefa in pendentes:
+                tarefa.cancel()
+
+    async def _proximo(self, espera):
+        """fila.get() com prazo; None se o prazo acabar.
+
+        Não usa asyncio.wait_for: antes do Python 3.12 ele engole o
+        cancelamento quando o get termina junto com o prazo, e parar()
+        ficava esperando o despachante para sempre.
+        """
+        get = asyncio.ensure_future(self.fila.get())
+        try:
+            await asyncio.wait({get}, timeout=espera)
+        except asyncio.CancelledError:
+            if get.done() and not get.cancelled():
+                # devolve o item para parar() responder o pedido
+                self.fila.put_nowait(get.result())
+            else:
+                get.cancel()
+            raise
+        if get.done():
+            return get.result()
+        get.cancel()
+        return None
+
+    async def _executar(self, lote):
+        loop = asyncio.get_running_loop()
+        try:
+            resultados = await loop.run_in_executor(
+                self.executor, _ordenar_lote, [dados for dados, _ in lote], self.n0)
+        except asyncio.CancelledError:
+            _falhar(lote, RuntimeError("servidor encerrado"))
+            raise
+        except Exception as e:
+            _falhar(lote, e)
+            return
+        finally:
+            self.em_voo.release()
+
+        self.lotes += 1
+        self.pedidos += len(lote)
+        for (_, fut), res in zip(lote, resultados):
+            if not fut.done():
+                fut.set_result(res)
+
+
+async def _responder(pedido_bruto, lote, writer, trava):
+    id_pedido = None
+    try:
+        if len(pedido_bruto) >= LINHA_NO_LOOP:
+            linha = await lote.processar_linha(pedido_bruto)
+        else:
+            pedido = json.loads(pedido_bruto)
+            if isinstance(pedido, dict):
+                id_pedido = pedido.get("id")
+            dados = _validar(pedido)
+            status, valor = await lote.ordenar(dados)
+            linha = _linha_resposta(id_pedido, status, valor)
+    except (ValueError, TypeError) as e:
+        # JSONDecodeError é subclasse de ValueError
+        linha = _linha_resposta(id_pedido, "erro", str(e))
+    except Exception as e:
+        # ex.: pool de processos quebrado; a conexão continua de pé
+        linha = _linha_resposta(id_pedido, "erro", f"erro interno: {e}")
+
+    async with trava:
+        if writer.is_closing():
+            # conexão fechada (cliente saiu ou servidor encerrando)
+            return
+        writer.write(linha)
+        await writer.drain()
+
+
+def criar_handler(lote, conexoes=None):
+    """Handler de conexão; se conexoes (dict) for dado, registra tarefa -> writer."""
+    async def handler(reader, writer):
+        if conexoes is not None:
+            conexoes[asyncio.current_task()] = writer
+        # respostas podem sair fora de ordem (use o "id" para casar)
+        trava = asyncio.Lock()
+        tarefas = set()
+        # cliente que manda pedidos em pipeline para de ser lido quando
+        # atinge o limite (o TCP segura o resto), em vez de acumular tarefas
+        vagas = asyncio.Semaphore(MAX_PEDIDOS_CONEXAO)
+        try:
+            while True:
+                try:
+                    linha = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not linha:
+                    break
+                if not linha.strip():
+                    continue
+                await vagas.acquire()
+                tarefa = asyncio.create_task(_responder(linha, lote, writer, trava))
+                tarefas.add(tarefa)
+                tarefa.add_done_callback(tarefas.discard)
+                tarefa.add_done_callback(lambda _: vagas.release())
+
+            if tarefas:
+                await asyncio.gather(*tarefas, return_exceptions=True)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            if conexoes is not None:
+                conexoes.pop(asyncio.current_task(), None)
+
+    return handler
+
+
+async def servir(host=HOST, porta=PORTA, n0=N0_PADRAO, workers=None, pronto=None):
+    """Sobe o servidor em host:porta (somente localhost por padrão) e roda até ser cancelado."""
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        lote = MicroLote(executor, n0=n0, lotes_em_voo=workers)
+        lote.iniciar()
+        conexoes = {}
+        servidor = await asyncio.start_server(criar_handler(lote, conexoes), host, porta,
+                                              limit=LIMITE_LINHA)
+        enderecos = ", ".join(str(s.getsockname()) for s in servidor.sockets)
+        print(f"Servidor de ordenação ouvindo em {enderecos} (n0={n0}, workers={workers})")
+        if pronto is not None:
+            pronto.set()
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            await lote.parar()
+            # fecha as conexões abertas para os handlers terminarem aqui, e não
+            # cancelados no fim do event loop
+            for writer in conexoes.values():
+                writer.close()
+            await asyncio.gather(*list(conexoes), return_exceptions=True)
+            if lote.lotes:
+                print(f"Pedidos atendidos: {lote.pedidos} em {lote.lotes} lotes "
+                      f"(média {lote.pedidos / lote.lotes:.1f} pedidos/lote)")
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(servir())
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")